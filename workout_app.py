@@ -1,11 +1,24 @@
+import numpy as np
 import pandas as pd
 import streamlit as st
 import gspread
 from google.oauth2.service_account import Credentials
+from google.auth.transport.requests import AuthorizedSession
+from requests.adapters import HTTPAdapter
+import re
 import time
-from streamlit_autorefresh import st_autorefresh
 import streamlit.components.v1 as components
 
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        return lambda func: func
+
+_WORKOUT_ACTUAL = re.compile(r'(?=.*Workout)(?=.*Actual)', re.S)
+_DAY_NUMBER_RE = re.compile(r'\d+')
+_REST_RE = re.compile(r'\s*(\d+)(?:\s*-\s*(\d+))?\s*(?:sec)?\s*', re.I)
+
 @st.cache_resource
 def authorize_gspread():
     """
@@ -17,110 +30,154 @@ def authorize_gspread():
             st.secrets["gcp_service_account"],
             scopes=["https://www.googleapis.com/auth/spreadsheets"]
         )
-        client = gspread.authorize(creds)
+        session = AuthorizedSession(creds)
+        session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
+        client = gspread.authorize(creds, session=session)
         return client
     except Exception as e:
         print(f"Помилка авторизації gspread: {e}")
         return None
 
+def _fingerprint(all_sheets_data):
+    """
+    Builds a cheap hashable key of the sheets content for use as a cache key.
+    """
+    return tuple(
+        (sheet_title, len(data), hash(tuple(map(tuple, data))))
+        for sheet_title, data in all_sheets_data.items()
+    )
+
 @st.cache_data(ttl=300)
-def load_and_process_history(_all_sheets_data):
+def index_sheets(fingerprint, _all_sheets_data):
     """
-    Processes all data from Google Sheets and converts it into a DataFrame suitable for analysis.
+    Scans every sheet once and returns per-sheet records shared by all consumers.
+    'filled_mask' marks non-empty Actual cells for every row; the first
+    'exercise_count' rows are the exercises of the plan. 'day_order' holds
+    the workout number parsed from each Actual header.
     """
-    history_records = []
-    workout_counter = 0
+    sheets_index = {}
 
     for sheet_title, data in _all_sheets_data.items():
         if len(data) < 3:
             continue
 
         headers = data[1]
-        exercise_rows = data[2:]
-
-        workout_cols = {
-            i: header for i, header in enumerate(headers)
-            if "Workout" in header and "Actual" in header
-        }
+        workout_cols = tuple(i for i, header in enumerate(headers) if _WORKOUT_ACTUAL.match(header))
 
         if not workout_cols:
             continue
 
-        for row_idx, row in enumerate(exercise_rows):
-            exercise_name = row[0]
-            if not exercise_name:
-                continue
-
-            for col_idx, day_title in workout_cols.items():
-                actual_result = row[col_idx]
-                if actual_result:
-                    history_records.append({
-                        "Sheet": sheet_title,
-                        "Day": day_title,
-                        "Exercise": exercise_name,
-                        "Actual_Raw": actual_result,
-                        "Workout_Order": workout_counter + int(day_title[8]),
-                    })
+        day_order = []
+        for pos, col in enumerate(workout_cols):
+            match = _DAY_NUMBER_RE.search(headers[col])
+            day_order.append(int(match.group()) if match else pos + 1)
+
+        rows = (
+            pd.DataFrame(data[2:])
+            .reindex(columns=range(len(headers)))
+            .fillna("")
+            .to_numpy(dtype=object)
+        )
+        named_mask = rows[:, 0] != ""
+        exercise_count = len(named_mask) if named_mask.all() else int(np.argmin(named_mask))
+
+        sheets_index[sheet_title] = {
+            "headers": headers,
+            "rows": rows,
+            "workout_cols": workout_cols,
+            "day_order": tuple(day_order),
+            "exercise_count": exercise_count,
+            "named_mask": named_mask,
+            "filled_mask": rows[:, list(workout_cols)] != "",
+        }
+
+    return sheets_index
+
+@st.cache_data(ttl=300)
+def load_and_process_history(fingerprint, _all_sheets_data):
+    """
+    Processes all data from Google Sheets and converts it into a DataFrame suitable for analysis.
+    """
+    frames = []
+    workout_counter = 0
+
+    for sheet_title, sheet in index_sheets(fingerprint, _all_sheets_data).items():
+        rows = sheet["rows"]
+        workout_cols = np.array(sheet["workout_cols"])
+        headers = np.array(sheet["headers"], dtype=object)
+        day_order = np.array(sheet["day_order"])
+        sheet_label = sheet_title.replace("Month 1 - ", "M1-")
+        day_labels = np.array(
+            [f"{sheet_label} / {headers[col].replace(' (Actual)', '')}" for col in workout_cols],
+            dtype=object
+        )
+
+        # Walk the mask column by column so records come out ordered by Workout_Order.
+        col_pos, row_idx = np.nonzero((sheet["filled_mask"] & sheet["named_mask"][:, None]).T)
+        cols = workout_cols[col_pos]
+
+        frames.append(pd.DataFrame({
+            "Sheet": sheet_title,
+            "Day": headers[cols],
+            "Exercise": rows[row_idx, 0],
+            "Actual_Raw": rows[row_idx, cols],
+            "Workout_Order": workout_counter + day_order[col_pos],
+            "Workout_Label": day_labels[col_pos],
+        }))
         workout_counter += len(workout_cols)
 
-    if not history_records:
+    if not frames:
         return pd.DataFrame()
 
-    df = pd.DataFrame(history_records)
+    df = pd.concat(frames, ignore_index=True)
+    if df.empty:
+        return pd.DataFrame()
+
+    raw = df["Actual_Raw"].astype(str)
+    is_sec = raw.str.contains("sec", case=False, regex=False)
+
+    # Digits like '²' pass isdigit() but not int(); cells containing them are left empty.
+    sec_first = raw[is_sec].str.split("-").str[0]
+    sec_digits = sec_first.str.replace(r"\D", "", regex=True)
+    sec_other = sec_first.str.replace(r"\d", "", regex=True).str.findall(r"[^\W_]").explode()
+    sec_unparsable = (
+        sec_other.str.isdigit().eq(True).groupby(level=0).any()
+        .reindex(sec_digits.index, fill_value=False)
+        | sec_digits.eq("")
+    )
+    sec_vals = sec_digits.mask(sec_unparsable, "0").astype(int).mask(sec_unparsable)
+
+    rep_tokens = raw[~is_sec].str.replace(",", " ", regex=False).str.split().explode()
+    rep_tokens = rep_tokens[rep_tokens.str.isdigit().eq(True)]
+    is_decimal = rep_tokens.str.isdecimal()
+    unparsable = (~is_decimal).groupby(level=0).any().reindex(raw.index[~is_sec], fill_value=False)
+    rep_vals = (
+        rep_tokens[is_decimal].astype(int)
+        .groupby(level=0).sum()
+        .reindex(raw.index[~is_sec], fill_value=0)
+        .mask(unparsable)
+    )
 
-    def parse_actual(value_str):
-        try:
-            if 'sec' in value_str.lower():
-                return int("".join(filter(str.isdigit, value_str.split('-')[0])))
-            parts = [int(s.strip()) for s in value_str.replace(',', ' ').split() if s.isdigit()]
-            return sum(parts)
-        except Exception:
-            return None
+    df["Metric (Total Volume/Time)"] = pd.concat([sec_vals, rep_vals]).sort_index()
 
-    df["Metric (Total Volume/Time)"] = df["Actual_Raw"].apply(parse_actual)
-    df['Workout_Label'] = df['Sheet'].str.replace("Month 1 - ", "M1-") + " / " + df['Day'].str.replace(" (Actual)", "")
-    df = df.sort_values(by="Workout_Order")
+    for column in ["Sheet", "Day", "Exercise", "Workout_Label"]:
+        df[column] = pd.Categorical(df[column], categories=df[column].unique())
+    df["Workout_Order"] = df["Workout_Order"].astype("int16")
 
     return df
 
-def calculate_overall_completion(all_sheets_data):
+@st.cache_data(ttl=300)
+def calculate_overall_completion(fingerprint, _all_sheets_data):
     """
     Calculates the overall completion percentage of all workouts.
     """
     total_slots = 0
     filled_slots = 0
 
-    for sheet_title, data in all_sheets_data.items():
-        if len(data) < 3:
-            continue
-
-        headers = data[1]
-        exercise_rows = data[2:]
-
-        workout_col_indices = [
-            i for i, header in enumerate(headers)
-            if "Workout" in header and "Actual" in header
-        ]
-
-        if not workout_col_indices:
-            continue
-
-        num_exercises_in_sheet = 0
-        for row in exercise_rows:
-            if row and row[0]:
-                num_exercises_in_sheet += 1
-            else:
-                break
-
-        if num_exercises_in_sheet == 0:
-            continue
-
-        total_slots += (num_exercises_in_sheet * len(workout_col_indices))
-
-        for i in range(num_exercises_in_sheet):
-            for col_idx in workout_col_indices:
-                if exercise_rows[i][col_idx]:
-                    filled_slots += 1
+    for sheet in index_sheets(fingerprint, _all_sheets_data).values():
+        plan_mask = sheet["filled_mask"][:sheet["exercise_count"]]
+        total_slots += plan_mask.size
+        filled_slots += int(np.count_nonzero(plan_mask))
 
     if total_slots == 0:
         return 0, 0, 0.0
@@ -138,10 +195,14 @@ def render_history_tab():
         st.warning("Спочатку потрібно запустити програму з вкладки 'Тренування'.")
         return
 
-    all_data = get_workout_data(st.session_state.client, st.secrets["gcp_service_account"]["sheet_id"])[1]
+    all_data = get_all_sheets_data(st.secrets["gcp_service_account"]["sheet_id"])
+    if not all_data:
+        return
+
+    fingerprint = _fingerprint(all_data)
 
     st.subheader("Загальний Прогрес Виконання")
-    total, filled, perc = calculate_overall_completion(all_data)
+    total, filled, perc = calculate_overall_completion(fingerprint, all_data)
 
     if total > 0:
         st.progress(int(perc), text=f"{perc:.1f}% Завершено")
@@ -153,21 +214,27 @@ def render_history_tab():
 
     st.divider()
 
-    df_history = load_and_process_history(all_data)
+    df_history = load_and_process_history(fingerprint, all_data)
 
     if df_history.empty:
         st.info("Ти ще не завершив жодного тренування. Історія для графіків порожня.")
         return
 
     st.subheader("Аналіз по Вправах")
-    all_exercises = df_history["Exercise"].unique()
+    if isinstance(df_history["Exercise"].dtype, pd.CategoricalDtype):
+        all_exercises = df_history["Exercise"].cat.categories
+    else:
+        all_exercises = df_history["Exercise"].unique()
     selected_exercise = st.selectbox(
         "Обери вправу, щоб побачити прогрес:",
         all_exercises
     )
 
     if selected_exercise:
-        df_exercise = df_history[df_history["Exercise"] == selected_exercise].copy()
+        df_exercise = df_history.loc[
+            df_history["Exercise"].eq(selected_exercise),
+            ["Workout_Label", "Metric (Total Volume/Time)", "Actual_Raw", "Sheet", "Day"]
+        ]
 
         if df_exercise.empty:
             st.warning("Немає даних для цієї вправи.")
@@ -191,86 +258,129 @@ def render_history_tab():
                 "Sheet", "Day", "Actual_Raw", "Metric (Total Volume/Time)"
             ]].set_index("Sheet"))
 
+@st.cache_resource
+def get_workbook(_client, sheet_id):
+    """
+    Opens the spreadsheet once per process and shares the handle between sessions.
+    """
+    return _client.open_by_key(sheet_id)
+
 @st.cache_data(ttl=300)
-def get_workout_data(_client, sheet_id):
+def get_all_sheets_data(sheet_id):
     """
-    Fetches all data from the spreadsheet in a single request.
+    Fetches the values of every 'Month' sheet in a single batchGet request.
+    The snapshot is shared between sessions.
     """
     try:
-        workbook = _client.open_by_key(sheet_id)
+        workbook = get_workbook(authorize_gspread(), sheet_id)
         sheets = workbook.worksheets()
 
+        titles = [sheet.title for sheet in sheets if sheet.title.startswith("Month")]
+        if not titles:
+            return {}
+
+        response = workbook.values_batch_get(
+            ranges=["'{}'".format(title.replace("'", "''")) for title in titles]
+        )
+
         all_sheets_data = {}
-        for sheet in sheets:
-            if sheet.title.startswith("Month"):
-                all_sheets_data[sheet.title] = sheet.get_all_values()
+        for title, value_range in zip(titles, response["valueRanges"]):
+            all_sheets_data[title] = gspread.utils.fill_gaps(value_range.get("values", []))
 
-        return workbook, all_sheets_data
+        return all_sheets_data
     except Exception as e:
         st.error(f"Помилка читання таблиці: {e}")
-        return None, None
+        return None
 
-def find_next_workout_and_exercises(all_sheets_data):
+def _parse_rest(rest):
     """
-    Finds the next workout day and assembles the list of exercises.
+    Parses a rest duration like '60 sec' or '60-90 sec' into seconds. Returns None if it can't be parsed.
     """
-    for sheet_title, data in all_sheets_data.items():
-        if len(data) < 3:
-            continue
-
-        headers = data[1]
-        exercise_rows = data[2:]
-
-        workout_col_indices = [
-            i for i, header in enumerate(headers)
-            if "Workout" in header and "Actual" in header
-        ]
-
-        if not workout_col_indices:
-            continue
-
-        last_exercise_row_index = -1
-        for i, row in enumerate(exercise_rows):
-            if row and row[0]:
-                last_exercise_row_index = i
-            else:
-                break
+    match = _REST_RE.fullmatch(rest)
+    if not match:
+        return None
+    return int(match.group(2) or match.group(1))
 
-        if last_exercise_row_index == -1:
-            continue
+@njit(cache=True)
+def _find_first_open_workout(last_row_filled, sheet_offsets):
+    """
+    Returns (sheet position, column position) of the first workout whose last exercise is empty, or (-1, -1).
+    """
+    for sheet_pos in range(len(sheet_offsets) - 1):
+        for i in range(sheet_offsets[sheet_pos], sheet_offsets[sheet_pos + 1]):
+            if not last_row_filled[i]:
+                return sheet_pos, i - sheet_offsets[sheet_pos]
+    return -1, -1
 
-        for col_index in workout_col_indices:
-            if not exercise_rows[last_exercise_row_index][col_index]:
-                exercises_to_do = []
-                for i, row in enumerate(exercise_rows):
-                    if not row or not row[0]:
-                        break
-
-                    if not row[col_index]:
-                        exercise = {
-                            "name": row[0],
-                            "sets_goal": row[1],
-                            "reps_goal": row[2],
-                            "rest": row[3],
-                            "gspread_row": i + 3,
-                            "gspread_col": col_index + 1
-                        }
-                        exercises_to_do.append(exercise)
-
-                if exercises_to_do:
-                    return sheet_title, exercises_to_do, headers[col_index]
-
-    return None, [], None
+def find_next_workout_and_exercises(fingerprint, all_sheets_data):
+    """
+    Finds the next workout day and assembles the exercises as parallel lists
+    ('names', 'sets_goal', 'reps_goal', 'rest', 'rest_seconds', 'gspread_row', 'gspread_col').
+    """
+    sheets = [
+        (sheet_title, sheet)
+        for sheet_title, sheet in index_sheets(fingerprint, all_sheets_data).items()
+        if sheet["exercise_count"] > 0
+    ]
+    if not sheets:
+        return None, {}, None
+
+    last_row_filled = np.concatenate([
+        sheet["filled_mask"][sheet["exercise_count"] - 1] for _, sheet in sheets
+    ])
+    sheet_offsets = np.cumsum([0] + [len(sheet["workout_cols"]) for _, sheet in sheets])
+
+    sheet_pos, col_pos = _find_first_open_workout(last_row_filled, sheet_offsets)
+    if sheet_pos < 0:
+        return None, {}, None
+
+    sheet_title, sheet = sheets[sheet_pos]
+    rows = sheet["rows"]
+    col_index = sheet["workout_cols"][col_pos]
+
+    todo_rows = np.flatnonzero(~sheet["filled_mask"][:sheet["exercise_count"], col_pos])
+    exercises_to_do = {
+        "names": rows[todo_rows, 0].tolist(),
+        "sets_goal": rows[todo_rows, 1].tolist(),
+        "reps_goal": rows[todo_rows, 2].tolist(),
+        "rest": rows[todo_rows, 3].tolist(),
+        "gspread_row": (todo_rows + 3).tolist(),
+        "gspread_col": [col_index + 1] * len(todo_rows),
+    }
+    exercises_to_do["rest_seconds"] = [_parse_rest(rest) for rest in exercises_to_do["rest"]]
+
+    return sheet_title, exercises_to_do, sheet["headers"][col_index]
 
 def update_google_sheet(sheet_title, row, col, value):
     """
-    Updates a single cell.
+    Queues a single cell update. Written to the sheet by flush_pending_writes().
+    """
+    st.session_state.setdefault("pending_writes", []).append({
+        "range": gspread.utils.absolute_range_name(sheet_title, gspread.utils.rowcol_to_a1(row, col)),
+        "value": value,
+    })
+    st.toast(f"Збережено: {value}", icon="✅")
+
+def flush_pending_writes():
+    """
+    Sends all queued cell updates to the spreadsheet in a single batchUpdate request.
+    Returns True if nothing is left in the queue.
     """
+    pending = st.session_state.get("pending_writes")
+    if not pending:
+        return True
+
     try:
-        st.session_state.workbook.worksheet(sheet_title).update_cell(row, col, value)
-        st.toast(f"Збережено: {value}", icon="✅")
+        st.session_state.workbook.values_batch_update(body={
+            "valueInputOption": "USER_ENTERED",
+            "data": [{"range": w["range"], "values": [[w["value"]]]} for w in pending],
+        })
     except Exception as e:
         st.error(f"Помилка збереження: {e}")
+        return False
+
+    st.session_state.pending_writes = []
+    return True
 
 def initialize_session():
     """
@@ -281,17 +391,17 @@ def initialize_session():
     if client:
         st.toast("✅ Підключено до Google Sheets!", icon="🔌")
         st.session_state.client = client
-        st.session_state.workbook, all_data = get_workout_data(
-            client,
-            st.secrets["gcp_service_account"]["sheet_id"]
-        )
+        sheet_id = st.secrets["gcp_service_account"]["sheet_id"]
+        all_data = get_all_sheets_data(sheet_id)
 
         if all_data:
-            sheet_title, exercises, day_title = find_next_workout_and_exercises(all_data)
+            st.session_state.workbook = get_workbook(client, sheet_id)
+            sheet_title, exercises, day_title = find_next_workout_and_exercises(_fingerprint(all_data), all_data)
             st.session_state.sheet_title = sheet_title
             st.session_state.exercises_today = exercises
             st.session_state.day_title = day_title
             st.session_state.current_exercise_index = 0
+            st.session_state.pending_writes = []
             st.session_state.current_view = "workout"
             st.session_state.app_ready = True
         else:
@@ -309,20 +419,20 @@ def render_workout_view():
     """
     idx = st.session_state.current_exercise_index
 
-    if idx >= len(st.session_state.exercises_today):
+    exercises = st.session_state.exercises_today
+
+    if idx >= len(exercises["names"]):
         st.session_state.current_view = "done"
         st.rerun()
         return
 
-    ex = st.session_state.exercises_today[idx]
-
-    st.header(f"🏋️ {ex['name']}")
+    st.header(f"🏋️ {exercises['names'][idx]}")
     st.divider()
 
     col1, col2, col3 = st.columns(3)
-    col1.metric("Підходи", ex['sets_goal'])
-    col2.metric("Повторення", ex['reps_goal'])
-    col3.metric("Відпочинок", ex['rest'])
+    col1.metric("Підходи", exercises['sets_goal'][idx])
+    col2.metric("Повторення", exercises['reps_goal'][idx])
+    col3.metric("Відпочинок", exercises['rest'][idx])
 
     st.divider()
 
@@ -344,19 +454,15 @@ def render_workout_view():
 
             update_google_sheet(
                 st.session_state.sheet_title,
-                ex['gspread_row'],
-                ex['gspread_col'],
+                exercises['gspread_row'][idx],
+                exercises['gspread_col'][idx],
                 actual_result
             )
 
-            rest_time_str = ex['rest'].lower().replace('sec', '').strip()
-            try:
-                if '-' in rest_time_str:
-                    rest_time_str = rest_time_str.split('-')[1]
-                rest_duration = int(rest_time_str)
-            except ValueError:
+            rest_duration = exercises['rest_seconds'][idx]
+            if rest_duration is None:
                 st.warning("Не вдалося розпізнати час відпочинку. Ставлю 60 сек.")
-                rest_duration = 5
+                rest_duration = 60
 
             st.session_state.rest_duration = rest_duration
             st.session_state.rest_start_time = time.time()
@@ -364,33 +470,44 @@ def render_workout_view():
             st.session_state.sound_played = False
             st.rerun()
 
-def render_rest_view():
+def _rest_remaining():
     """
-    Renders the running rest timer and the next exercise. Updated version with one-time balloons and looping sound.
+    Returns the number of whole seconds left on the rest timer.
     """
-    st_autorefresh(interval=1000, key="rest_timer_refresh")
+    elapsed = time.time() - st.session_state.rest_start_time
+    return int(st.session_state.rest_duration - elapsed)
 
-    start_time = st.session_state.rest_start_time
-    duration = st.session_state.rest_duration
+@st.fragment(run_every=1.0)
+def render_rest_countdown():
+    """
+    Renders the countdown and the next exercise. Only this fragment reruns every second.
+    """
+    remaining = _rest_remaining()
 
-    elapsed = time.time() - start_time
-    remaining = int(duration - elapsed)
+    if remaining <= 0:
+        st.rerun(scope="app")
 
-    if remaining > 0:
-        st.header("⏳ Відпочинок...")
+    st.header("⏳ Відпочинок...")
 
-        minutes = remaining // 60
-        seconds = remaining % 60
-        st.metric("Залишилось часу:", f"{minutes:02d}:{seconds:02d}")
+    minutes = remaining // 60
+    seconds = remaining % 60
+    st.metric("Залишилось часу:", f"{minutes:02d}:{seconds:02d}")
 
-        next_idx = st.session_state.current_exercise_index + 1
-        if next_idx < len(st.session_state.exercises_today):
-            next_ex = st.session_state.exercises_today[next_idx]
-            with st.expander(f"Наступна вправа: {next_ex['name']}", expanded=True):
-                st.info("Підготуйся! Поки відпочиваєш, можеш загуглити техніку.")
-                st.text(f"План: {next_ex['sets_goal']} / {next_ex['reps_goal']}")
-        else:
-            st.info("Це була остання вправа!")
+    exercises = st.session_state.exercises_today
+    next_idx = st.session_state.current_exercise_index + 1
+    if next_idx < len(exercises["names"]):
+        with st.expander(f"Наступна вправа: {exercises['names'][next_idx]}", expanded=True):
+            st.info("Підготуйся! Поки відпочиваєш, можеш загуглити техніку.")
+            st.text(f"План: {exercises['sets_goal'][next_idx]} / {exercises['reps_goal'][next_idx]}")
+    else:
+        st.info("Це була остання вправа!")
+
+def render_rest_view():
+    """
+    Renders the running rest timer and the next exercise. Updated version with one-time balloons and looping sound.
+    """
+    if _rest_remaining() > 0:
+        render_rest_countdown()
 
     else:
         st.header("✅ Час вийшов!")
@@ -413,25 +530,32 @@ def render_rest_view():
             )
 
         if st.button("Далі!", type="primary", use_container_width=True):
-            st.session_state.play_sound = False
-            st.session_state.timer_finished = False
+            if flush_pending_writes():
+                st.session_state.play_sound = False
+                st.session_state.timer_finished = False
 
-            st.session_state.current_exercise_index += 1
-            st.session_state.current_view = "workout"
-            st.rerun()
+                st.session_state.current_exercise_index += 1
+                st.session_state.current_view = "workout"
+                st.rerun()
 
 def render_done_view():
     """
     Renders the workout completion screen.
     """
+    if not flush_pending_writes():
+        st.warning("Результати ще не збережено в Google Sheets. Перевір з'єднання та спробуй ще раз.")
+        if st.button("Спробувати зберегти ще раз", type="primary", use_container_width=True):
+            st.rerun()
+        return
+
     st.balloons()
     st.title("🎉 Чудова Робота! 🎉")
     st.header(f"Тренування '{st.session_state.day_title}' завершено.")
     st.subheader(f"Дані збережено в аркуші '{st.session_state.sheet_title}'.")
 
     if st.button("Почати нове тренування (якщо є)"):
-        for key in st.session_state.keys():
-            del st.session_state[key]
+        get_all_sheets_data.clear()
+        st.session_state.clear()
         st.rerun()
 
 st.set_page_config(layout="centered")